@@ -35,6 +35,9 @@ export class ClaudeChatPlugin extends Plugin {
 	settings: ClaudeChatSettings;
 	private cliService: ClaudeCLIService;
 	cliAvailable = false;
+	cliChecking = false;
+	// Settles once the startup CLI check has finished; never rejects
+	cliReady: Promise<void> = Promise.resolve();
 	chatHistory: ChatMessage[] = [];
 	currentSessionId: string | null = null;
 
@@ -45,15 +48,6 @@ export class ClaudeChatPlugin extends Plugin {
 		// Initialize Claude CLI service
 		this.cliService = new ClaudeCLIService();
 
-		// Check CLI availability
-		if (this.settings.autoDetectCLI) {
-			this.cliAvailable = await this.cliService.checkCLIAvailability();
-			
-			if (!this.cliAvailable) {
-				new Notice('Claude CLI not found. Please install Claude Code for full functionality.');
-			}
-		}
-
 		// Register commands
 		this.addCommand({
 			id: 'open-chat',
@@ -81,6 +75,27 @@ export class ClaudeChatPlugin extends Plugin {
 
 		// Start with new session
 		this.startNewSession();
+
+		// Check CLI availability in the background; registration above does not depend on it
+		if (this.settings.autoDetectCLI) {
+			this.cliReady = this.detectCLI();
+		}
+	}
+
+	private async detectCLI(): Promise<void> {
+		this.cliChecking = true;
+		try {
+			this.cliAvailable = await this.cliService.checkCLIAvailability();
+		} catch (error) {
+			console.error('Failed to check Claude CLI availability:', error);
+			this.cliAvailable = false;
+		} finally {
+			this.cliChecking = false;
+		}
+		
+		if (!this.cliAvailable) {
+			new Notice('Claude CLI not found. Please install Claude Code for full functionality.');
+		}
 	}
 
 	async onunload() {
@@ -131,6 +146,9 @@ export class ClaudeChatPlugin extends Plugin {
 
 	// Message Handling
 	async sendMessage(message: string): Promise<void> {
+		// A message sent right after startup waits for the CLI check instead of being rejected
+		await this.cliReady;
+
 		if (!this.cliAvailable) {
 			this.createNotice('Claude CLI is not available. Please install Claude Code.', 'error');
 			return;
@@ -160,7 +178,7 @@ export class ClaudeChatPlugin extends Plugin {
 			}
 
 			let assistantContent = '';
-			const startTime = Date.now();
+			const startTime = performance.now();
 
 			// Start chat with streaming response
 			await this.cliService.startChat(options, (response: StreamResponse) => {
@@ -181,7 +199,7 @@ export class ClaudeChatPlugin extends Plugin {
 
 			// Track performance if enabled
 			if (this.settings.showPerformanceMetrics) {
-				const responseTime = Date.now() - startTime;
+				const responseTime = Math.round(performance.now() - startTime);
 				console.log(`Claude response time: ${responseTime}ms`);
 			}
 
@@ -286,6 +304,8 @@ export class ClaudeChatPlugin extends Plugin {
 // Chat View Component
 class ChatView extends ItemView {
 	private plugin: ClaudeChatPlugin;
+	// Content span of the assistant message currently being streamed
+	private streamingContentEl: HTMLElement | null = null;
 
 	constructor(leaf: WorkspaceLeaf, plugin: ClaudeChatPlugin) {
 		super(leaf);
@@ -302,6 +322,7 @@ class ChatView extends ItemView {
 
 	async onOpen() {
 		// Initialize chat UI when view opens
+		this.streamingContentEl = null;
 		const container = this.containerEl.children[1];
 		container.empty();
 		
@@ -347,6 +368,7 @@ class ChatView extends ItemView {
 
 	onNewSession() {
 		// Handle new session in UI
+		this.streamingContentEl = null;
 		const messagesArea = this.containerEl.querySelector('.chat-messages');
 		if (messagesArea) {
 			messagesArea.empty();
@@ -355,23 +377,30 @@ class ChatView extends ItemView {
 	}
 
 	appendStreamingContent(content: string) {
-		// Append streaming content to UI
+		// Append streaming content to UI, reusing the element found for the previous chunk
+		if (this.streamingContentEl) {
+			this.streamingContentEl.textContent += content;
+			return;
+		}
+
 		const messagesArea = this.containerEl.querySelector('.chat-messages');
 		if (messagesArea) {
 			const lastMessage = messagesArea.querySelector('.message.assistant:last-child .content') as HTMLElement;
 			if (lastMessage) {
 				lastMessage.textContent += content;
+				this.streamingContentEl = lastMessage;
 			} else {
 				// Create new assistant message
 				const messageDiv = messagesArea.createEl('div', { cls: 'message assistant' });
 				messageDiv.createEl('span', { cls: 'role', text: '🤖 Claude: ' });
-				messageDiv.createEl('span', { cls: 'content', text: content });
+				this.streamingContentEl = messageDiv.createEl('span', { cls: 'content', text: content });
 			}
 		}
 	}
 
 	onStreamingComplete() {
 		// Handle streaming completion in UI
+		this.streamingContentEl = null;
 		const messagesArea = this.containerEl.querySelector('.chat-messages');
 		if (messagesArea) {
 			messagesArea.scrollTop = messagesArea.scrollHeight;
@@ -380,6 +409,7 @@ class ChatView extends ItemView {
 
 	updateHistory(history: ChatMessage[]) {
 		// Update chat history in UI
+		this.streamingContentEl = null;
 		const messagesArea = this.containerEl.querySelector('.chat-messages');
 		if (messagesArea) {
 			messagesArea.empty();
@@ -493,12 +523,12 @@ class ClaudeChatSettingTab extends PluginSettingTab {
 		containerEl.createEl('h3', { text: 'Status' });
 
 		const statusEl = containerEl.createEl('div', { cls: 'claude-chat-status' });
-		const cliStatus = this.plugin.cliAvailable ? '✅ Available' : '❌ Not Found';
+		const cliStatus = this.plugin.cliChecking ? '⏳ Checking…' : this.plugin.cliAvailable ? '✅ Available' : '❌ Not Found';
 		statusEl.createEl('p', { text: `Claude CLI: ${cliStatus}` });
 
 		if (this.plugin.settings.showPerformanceMetrics && this.plugin.cliAvailable) {
 			const metrics = this.plugin.getPerformanceMetrics();
-			statusEl.createEl('p', { text: `Last Response Time: ${metrics.lastResponseTime}ms` });
+			statusEl.createEl('p', { text: `Last Response Time: ${Math.round(metrics.lastResponseTime)}ms` });
 			statusEl.createEl('p', { text: `Success Rate: ${metrics.successCount}/${metrics.successCount + metrics.errorCount}` });
 		}
 	}
@@ -34,6 +34,9 @@ export interface PerformanceMetrics {
   averageResponseTime: number;
 }
 
+// Number of recent response times averaged in the performance metrics
+const RESPONSE_TIME_WINDOW = 100;
+
 export class ClaudeCLIService extends EventEmitter {
   private currentProcess: ChildProcess | null = null;
   private isProcessing = false;
@@ -44,7 +47,11 @@ export class ClaudeCLIService extends EventEmitter {
     errorCount: 0,
     averageResponseTime: 0
   };
-  private responseTimes: number[] = [];
+  // Ring buffer of recent response times plus a running sum for the average
+  private responseTimes = new Float64Array(RESPONSE_TIME_WINDOW);
+  private responseTimeCount = 0;
+  private responseTimeIndex = 0;
+  private responseTimeSum = 0;
 
   constructor() {
     super();
@@ -57,19 +64,21 @@ export class ClaudeCLIService extends EventEmitter {
     return new Promise((resolve) => {
       const process = spawn('claude', ['--version']);
       
+      // Timeout after 5 seconds
+      const timeoutId = setTimeout(() => {
+        process.kill();
+        resolve(false);
+      }, 5000);
+      
       process.on('close', (code) => {
+        clearTimeout(timeoutId);
         resolve(code === 0);
       });
       
       process.on('error', () => {
+        clearTimeout(timeoutId);
         resolve(false);
       });
-      
-      // Timeout after 5 seconds
-      setTimeout(() => {
-        process.kill();
-        resolve(false);
-      }, 5000);
     });
   }
 
@@ -111,42 +120,42 @@ export class ClaudeCLIService extends EventEmitter {
    * Parse streaming JSON response from Claude CLI
    */
   parseStreamResponse(data: string): StreamResponse[] {
-    const lines = data.split('\n').filter(line => line.trim());
-    const responses: StreamResponse[] = [];
-
-    for (const line of lines) {
-      try {
-        const parsed = JSON.parse(line);
-        responses.push(parsed);
-      } catch (error) {
-        // Skip malformed JSON lines
-        continue;
-      }
-    }
-
-    return responses;
+    return this.parseLines(data.split('\n'));
   }
 
   /**
    * Handle partial stream chunks and return parsed responses
    */
   handleStreamChunk(chunk: string): StreamResponse[] {
-    this.partialData += chunk;
-    const lines = this.partialData.split('\n');
+    // A chunk without a newline cannot complete a line, so skip re-splitting the buffer
+    if (chunk.indexOf('\n') === -1) {
+      this.partialData += chunk;
+      return [];
+    }
+
+    const lines = (this.partialData + chunk).split('\n');
     
     // Keep the last incomplete line for next chunk
     this.partialData = lines.pop() || '';
     
+    return this.parseLines(lines);
+  }
+
+  /**
+   * Parse complete JSON lines, skipping blank and malformed ones
+   */
+  private parseLines(lines: string[]): StreamResponse[] {
     const responses: StreamResponse[] = [];
+
     for (const line of lines) {
-      if (line.trim()) {
-        try {
-          const parsed = JSON.parse(line);
-          responses.push(parsed);
-        } catch (error) {
-          // Skip malformed JSON
-          continue;
-        }
+      if (!line.trim()) {
+        continue;
+      }
+      try {
+        responses.push(JSON.parse(line));
+      } catch (error) {
+        // Skip malformed JSON lines
+        continue;
       }
     }
 
@@ -165,7 +174,7 @@ export class ClaudeCLIService extends EventEmitter {
     }
 
     this.isProcessing = true;
-    const startTime = Date.now();
+    const startTime = performance.now();
 
     return new Promise((resolve, reject) => {
       const command = this.buildCLICommand(options);
@@ -212,7 +221,7 @@ export class ClaudeCLIService extends EventEmitter {
       // Handle process completion
       this.currentProcess.on('close', (code) => {
         clearTimeout(timeoutId);
-        const responseTime = Date.now() - startTime;
+        const responseTime = performance.now() - startTime;
         
         this.updatePerformanceMetrics(responseTime, code === 0);
         this.cleanup();
@@ -227,7 +236,7 @@ export class ClaudeCLIService extends EventEmitter {
       // Handle process errors
       this.currentProcess.on('error', (error) => {
         clearTimeout(timeoutId);
-        this.updatePerformanceMetrics(Date.now() - startTime, false);
+        this.updatePerformanceMetrics(performance.now() - startTime, false);
         this.cleanup();
         reject(error);
       });
@@ -246,15 +255,18 @@ export class ClaudeCLIService extends EventEmitter {
       this.performanceMetrics.errorCount++;
     }
 
-    this.responseTimes.push(responseTime);
-    
-    // Keep only last 100 response times for average calculation
-    if (this.responseTimes.length > 100) {
-      this.responseTimes.shift();
+    // Overwrite the oldest slot once the window is full
+    if (this.responseTimeCount === RESPONSE_TIME_WINDOW) {
+      this.responseTimeSum -= this.responseTimes[this.responseTimeIndex];
+    } else {
+      this.responseTimeCount++;
     }
 
-    this.performanceMetrics.averageResponseTime = 
-      this.responseTimes.reduce((sum, time) => sum + time, 0) / this.responseTimes.length;
+    this.responseTimes[this.responseTimeIndex] = responseTime;
+    this.responseTimeSum += responseTime;
+    this.responseTimeIndex = (this.responseTimeIndex + 1) % RESPONSE_TIME_WINDOW;
+
+    this.performanceMetrics.averageResponseTime = this.responseTimeSum / this.responseTimeCount;
   }
 
   /**
@@ -3,6 +3,33 @@
  * Provides comprehensive mocks for all Obsidian components used by the plugin.
  */
 
+// Mock the DOM helpers Obsidian adds to HTMLElement
+interface DomElementInfo {
+  cls?: string;
+  text?: string;
+  type?: string;
+  placeholder?: string;
+}
+
+if (typeof HTMLElement !== 'undefined' && !(HTMLElement.prototype as any).createEl) {
+  Object.assign(HTMLElement.prototype, {
+    createEl(this: HTMLElement, tag: string, info: DomElementInfo = {}): HTMLElement {
+      const element = document.createElement(tag);
+      if (info.cls) element.className = info.cls;
+      if (info.text !== undefined) element.textContent = info.text;
+      if (info.type) element.setAttribute('type', info.type);
+      if (info.placeholder) element.setAttribute('placeholder', info.placeholder);
+      this.appendChild(element);
+      return element;
+    },
+    empty(this: HTMLElement): void {
+      while (this.firstChild) {
+        this.removeChild(this.firstChild);
+      }
+    }
+  });
+}
+
 // Mock App interface
 export class MockApp {
   workspace = new MockWorkspace();
@@ -57,6 +84,21 @@ export class MockView {
   }
 }
 
+// Mock ItemView base class
+export class ItemView extends MockView {
+  leaf: MockWorkspaceLeaf;
+  containerEl: HTMLElement;
+  
+  constructor(leaf: MockWorkspaceLeaf) {
+    super();
+    this.leaf = leaf;
+    // Obsidian views hold a header element followed by the content element
+    this.containerEl = document.createElement('div');
+    this.containerEl.appendChild(document.createElement('div'));
+    this.containerEl.appendChild(document.createElement('div'));
+  }
+}
+
 // Mock MarkdownView interface
 export class MockMarkdownView extends MockView {
   editor = new MockEditor();
@@ -161,6 +203,7 @@ export class MockTFile {
 export class Plugin {
   app: MockApp;
   manifest: any;
+  commands: Record<string, any> = {};
   
   constructor(app: MockApp, manifest: any) {
     this.app = app;
@@ -176,7 +219,7 @@ export class Plugin {
   }
   
   addCommand(command: any): void {
-    // Mock command registration
+    this.commands[command.id] = command;
   }
   
   addRibbonIcon(icon: string, title: string, callback: Function): HTMLElement {
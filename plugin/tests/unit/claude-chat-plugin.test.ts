@@ -7,8 +7,7 @@ import { App, Editor, MarkdownView, Plugin, TFile } from 'obsidian';
 import { ClaudeChatPlugin } from '../../main';
 import { ClaudeCLIService } from '../../src/claude-cli-service';
 
-// Mock Obsidian API
-jest.mock('obsidian');
+// Obsidian API is provided by tests/mocks/obsidian.ts through moduleNameMapper
 
 // Mock ClaudeCLIService
 jest.mock('../../src/claude-cli-service');
@@ -33,7 +32,8 @@ describe('ClaudeChatPlugin', () => {
         getLeavesOfType: jest.fn().mockReturnValue([]),
         getLeaf: jest.fn().mockReturnValue({
           openFile: jest.fn()
-        })
+        }),
+        revealLeaf: jest.fn()
       }
     } as any;
 
@@ -89,6 +89,7 @@ describe('ClaudeChatPlugin', () => {
       mockCLIService.checkCLIAvailability.mockResolvedValue(true);
 
       await plugin.onload();
+      await plugin.cliReady;
 
       expect(mockCLIService.checkCLIAvailability).toHaveBeenCalled();
       expect(plugin.cliAvailable).toBe(true);
@@ -98,8 +99,59 @@ describe('ClaudeChatPlugin', () => {
       mockCLIService.checkCLIAvailability.mockResolvedValue(false);
 
       await plugin.onload();
+      await plugin.cliReady;
+
+      expect(plugin.cliAvailable).toBe(false);
+    });
+
+    it('should register commands and the chat view while the CLI check is pending', async () => {
+      mockCLIService.checkCLIAvailability.mockReturnValue(new Promise(() => {}));
+      const addCommandSpy = jest.spyOn(plugin, 'addCommand');
+      const registerViewSpy = jest.spyOn(plugin, 'registerView');
+
+      await plugin.onload();
+
+      expect(addCommandSpy).toHaveBeenCalledWith(expect.objectContaining({ id: 'open-chat' }));
+      expect(addCommandSpy).toHaveBeenCalledWith(expect.objectContaining({ id: 'new-chat-session' }));
+      expect(registerViewSpy).toHaveBeenCalledWith('claude-chat', expect.any(Function));
+      expect(plugin.cliAvailable).toBe(false);
+      expect(plugin.cliChecking).toBe(true);
+    });
+
+    it('should treat a failed CLI check as unavailable', async () => {
+      mockCLIService.checkCLIAvailability.mockRejectedValue(new Error('spawn EPERM'));
+      jest.spyOn(console, 'error').mockImplementation();
+      const noticeSpy = jest.fn();
+      (plugin as any).createNotice = noticeSpy;
+
+      await plugin.onload();
+      await expect(plugin.cliReady).resolves.toBeUndefined();
 
       expect(plugin.cliAvailable).toBe(false);
+      expect(plugin.cliChecking).toBe(false);
+
+      await plugin.sendMessage('Hello');
+
+      expect(noticeSpy).toHaveBeenCalledWith('Claude CLI is not available. Please install Claude Code.', 'error');
+      expect(mockCLIService.startChat).not.toHaveBeenCalled();
+    });
+
+    it('should wait for the CLI check before sending the first message', async () => {
+      let finishCheck!: (available: boolean) => void;
+      mockCLIService.checkCLIAvailability.mockReturnValue(
+        new Promise<boolean>(resolve => { finishCheck = resolve; })
+      );
+      mockCLIService.startChat.mockResolvedValue(undefined);
+
+      await plugin.onload();
+      const sending = plugin.sendMessage('Hello during startup');
+      finishCheck(true);
+      await sending;
+
+      expect(mockCLIService.startChat).toHaveBeenCalledWith(
+        expect.objectContaining({ message: 'Hello during startup' }),
+        expect.any(Function)
+      );
     });
   });
 
@@ -128,7 +180,7 @@ describe('ClaudeChatPlugin', () => {
     });
 
     it('should open chat panel when command executed', async () => {
-      const openChatPanelSpy = jest.spyOn(plugin, 'openChatPanel');
+      const openChatPanelSpy = jest.spyOn(plugin, 'openChatPanel').mockResolvedValue(undefined);
 
       await plugin.executeCommand('open-chat');
 
@@ -259,6 +311,48 @@ describe('ClaudeChatPlugin', () => {
     });
   });
 
+  describe('Chat View', () => {
+    let view: any;
+
+    beforeEach(async () => {
+      mockCLIService.checkCLIAvailability.mockResolvedValue(true);
+      const registerViewSpy = jest.spyOn(plugin, 'registerView');
+      await plugin.onload();
+
+      const createView = registerViewSpy.mock.calls.find(([type]) => type === 'claude-chat')![1] as any;
+      view = createView({});
+      await view.onOpen();
+    });
+
+    it('should start a new assistant message after the history is re-rendered', () => {
+      view.appendStreamingContent('First');
+      view.appendStreamingContent(' reply');
+
+      view.updateHistory([
+        { type: 'user', content: 'Question 1', timestamp: new Date() },
+        { type: 'assistant', content: 'First reply', timestamp: new Date() },
+        { type: 'user', content: 'Question 2', timestamp: new Date() }
+      ]);
+      view.appendStreamingContent('Second reply');
+
+      const contents = view.containerEl.querySelectorAll('.message.assistant .content');
+      expect(contents).toHaveLength(2);
+      expect(contents[0].textContent).toBe('First reply');
+      expect(contents[1].textContent).toBe('Second reply');
+    });
+
+    it('should start a new assistant message after the view is reopened', async () => {
+      view.appendStreamingContent('Partial');
+
+      await view.onOpen();
+      view.appendStreamingContent('Fresh');
+
+      const contents = view.containerEl.querySelectorAll('.message.assistant .content');
+      expect(contents).toHaveLength(1);
+      expect(contents[0].textContent).toBe('Fresh');
+    });
+  });
+
   describe('Message History', () => {
     beforeEach(async () => {
       mockCLIService.checkCLIAvailability.mockResolvedValue(true);
@@ -346,6 +440,7 @@ describe('ClaudeChatPlugin', () => {
     });
 
     it('should handle missing CLI gracefully', async () => {
+      await plugin.cliReady;
       plugin.cliAvailable = false;
       const noticeSpy = jest.fn();
       (plugin as any).createNotice = noticeSpy;
@@ -362,35 +457,27 @@ describe('ClaudeChatPlugin', () => {
   describe('Performance Monitoring', () => {
     beforeEach(async () => {
       mockCLIService.checkCLIAvailability.mockResolvedValue(true);
-      plugin.settings.showPerformanceMetrics = true;
       await plugin.onload();
+      plugin.settings.showPerformanceMetrics = true;
     });
 
-    it('should track message timing when enabled', async () => {
-      mockCLIService.startChat.mockImplementation((options, callback) => {
-        setTimeout(() => {
-          callback({ type: 'content', content: 'Response' });
-          callback({ type: 'end' });
-        }, 100);
-        return Promise.resolve();
-      });
+    it('should log message timing when enabled', async () => {
+      const logSpy = jest.spyOn(console, 'log').mockImplementation();
+      mockCLIService.startChat.mockResolvedValue(undefined);
 
-      const startTime = Date.now();
       await plugin.sendMessage('Test timing');
-      const endTime = Date.now();
 
-      const metrics = plugin.getPerformanceMetrics();
-      expect(metrics.lastResponseTime).toBeGreaterThan(0);
-      expect(metrics.lastResponseTime).toBeLessThan(endTime - startTime + 50);
+      expect(logSpy).toHaveBeenCalledWith(expect.stringMatching(/^Claude response time: \d+ms$/));
     });
 
-    it('should not track timing when disabled', async () => {
+    it('should not log timing when disabled', async () => {
       plugin.settings.showPerformanceMetrics = false;
+      const logSpy = jest.spyOn(console, 'log').mockImplementation();
       mockCLIService.startChat.mockResolvedValue(undefined);
 
       await plugin.sendMessage('Test message');
 
-      expect(mockCLIService.getPerformanceMetrics).not.toHaveBeenCalled();
+      expect(logSpy).not.toHaveBeenCalledWith(expect.stringMatching(/^Claude response time/));
     });
   });
 
@@ -72,6 +72,23 @@ describe('ClaudeCLIService', () => {
       
       expect(isAvailable).toBe(false);
     });
+
+    it('should clear the probe timeout once the CLI answers', async () => {
+      jest.useFakeTimers();
+
+      try {
+        const availability = service.checkCLIAvailability();
+        mockProcess.emit('close', 0);
+
+        // Run past the 5 second watchdog; it must not fire after the probe settled
+        jest.advanceTimersByTime(5000);
+
+        expect(await availability).toBe(true);
+        expect(mockProcess.kill).not.toHaveBeenCalled();
+      } finally {
+        jest.useRealTimers();
+      }
+    });
   });
 
   describe('Command Construction', () => {
@@ -157,6 +174,18 @@ describe('ClaudeCLIService', () => {
       expect(parsed.length).toBe(1);
       expect(parsed[0]).toEqual({ type: 'content', content: 'Hello world' });
     });
+
+    it('should hold back output until a line is complete', () => {
+      expect(service.handleStreamChunk(`{"type":"content",`)).toEqual([]);
+      expect(service.handleStreamChunk(`"content":"Hi"}`)).toEqual([]);
+
+      const parsed = service.handleStreamChunk(`\n{"type":"end"}\n`);
+
+      expect(parsed).toEqual([
+        { type: 'content', content: 'Hi' },
+        { type: 'end' }
+      ]);
+    });
   });
 
   describe('Chat Session Management', () => {
@@ -316,6 +345,26 @@ describe('ClaudeCLIService', () => {
       expect(metrics.successCount).toBe(1);
       expect(metrics.errorCount).toBe(0);
     });
+
+    it('should average only the most recent 100 response times', () => {
+      for (let i = 0; i < 100; i++) {
+        (service as any).updatePerformanceMetrics(10, true);
+      }
+      expect(service.getPerformanceMetrics().averageResponseTime).toBe(10);
+
+      for (let i = 0; i < 50; i++) {
+        (service as any).updatePerformanceMetrics(30, true);
+      }
+      expect(service.getPerformanceMetrics().averageResponseTime).toBe(20);
+
+      for (let i = 0; i < 50; i++) {
+        (service as any).updatePerformanceMetrics(30, false);
+      }
+      const metrics = service.getPerformanceMetrics();
+      expect(metrics.averageResponseTime).toBe(30);
+      expect(metrics.successCount).toBe(150);
+      expect(metrics.errorCount).toBe(50);
+    });
   });
 });
 